@@ -1,4 +1,6 @@
 import os
+import io
+import csv
 import json
 import pandas as pd
 from sqlalchemy import create_engine
@@ -7,9 +9,175 @@ from pydantic import BaseModel, Field
 from typing import Type, Optional, List
 from superagi.resource_manager.file_manager import FileManager
 from pytrends.request import TrendReq
+from pytrends.exceptions import ResponseError, TooManyRequestsError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from cachetools.func import ttl_cache
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
 import time
 import random
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CLIENT_RETRIES = 3
+CLIENT_BACKOFF_FACTOR = 0.4
+
+# Concurrent requests stay under Google's rate limit without fixed pauses; 429s are handled by backoff.
+MAX_WORKERS = 3
+MAX_RETRIES = 5
+MAX_BACKOFF = 60
+
+CACHE_NAME = 'gtrends_cache'
+# Content types Google uses for API replies.
+API_CONTENT_TYPES = ('application/json', 'application/javascript', 'text/javascript')
+CACHE_EXPIRE = 3600
+SEASONALITY_CACHE_EXPIRE = 86400
+SEASONALITY_MIN_SPAN = pd.Timedelta(days=730)
+
+# Lowest SQLITE_MAX_VARIABLE_NUMBER still found in distributed SQLite builds.
+SQLITE_MAX_VARIABLES = 999
+
+SAVE_CHUNK_ROWS = 10_000
+
+SECTION_RULE = "-" * 30 + "\n"
+TREND_TABLE_HEADER = "Date\t\tInterest\n" + SECTION_RULE
+# Trend rows are rendered by a single to_csv call as "<date>\t<interest>" lines under TREND_TABLE_HEADER.
+TREND_TABLE_FORMAT = dict(sep='\t', header=False, date_format='%Y-%m-%d', lineterminator='\n')
+
+# pytrends keeps cookies and the current payload on the client, so every worker thread gets its own.
+_thread_local = threading.local()
+
+# Long-lived workers keep their clients (and Google cookies) across tool instances and _execute calls.
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='google-trends')
+    return _executor
+
+
+# Only pytrends API calls go through this session; the rest of the process keeps plain requests sessions.
+_cache_session = None
+_cache_session_lock = threading.Lock()
+
+
+def _is_api_response(response):
+    # Google also answers with status 200 HTML (consent, captcha, "unusual traffic" pages); those must never be
+    # cached, or they would be served back for the whole expiry.
+    content_type = response.headers.get('Content-Type', '')
+    return response.status_code == 200 and any(t in content_type for t in API_CONTENT_TYPES)
+
+
+def _get_cache_session():
+    global _cache_session
+    with _cache_session_lock:
+        if _cache_session is None:
+            session = requests_cache.CachedSession(CACHE_NAME, expire_after=CACHE_EXPIRE, allowable_methods=('GET', 'POST'),
+                                                   filter_fn=_is_api_response)
+            # 429 is left to _with_backoff, which waits far longer than urllib3's short retry backoff.
+            retry = Retry(total=CLIENT_RETRIES, read=CLIENT_RETRIES, connect=CLIENT_RETRIES,
+                          backoff_factor=CLIENT_BACKOFF_FACTOR,
+                          status_forcelist=[code for code in TrendReq.ERROR_CODES if code != 429],
+                          allowed_methods=frozenset(['GET', 'POST']))
+            session.mount('https://', HTTPAdapter(max_retries=retry))
+            _cache_session = session
+    return _cache_session
+
+
+class _CachedTrendReq(TrendReq):
+    """
+    TrendReq that sends its API calls through the shared on-disk request cache.
+    """
+    expire_after = CACHE_EXPIRE
+
+    def _get_data(self, url, method=TrendReq.GET_METHOD, trim_chars=0, **kwargs):
+        # Mirrors TrendReq._get_data (without proxy rotation, which this tool does not configure),
+        # but on the shared cached session instead of a fresh requests session per call.
+        session = _get_cache_session()
+        send = session.post if method == TrendReq.POST_METHOD else session.get
+        response = send(url, headers=self.headers, timeout=self.timeout, cookies=self.cookies,
+                        expire_after=self.expire_after, **kwargs, **self.requests_args)
+
+        if _is_api_response(response):
+            # Some responses start with garbage characters, like ")]}',", that have to be trimmed before parsing.
+            return json.loads(response.text[trim_chars:])
+        if response.status_code == 429:
+            raise TooManyRequestsError.from_response(response)
+        raise ResponseError.from_response(response)
+
+
+def _get_pytrends():
+    pytrends = getattr(_thread_local, 'pytrends', None)
+    if pytrends is None:
+        # Retries are configured once on the shared cache session; TrendReq's own settings only apply to the
+        # _get_data this class overrides.
+        pytrends = _CachedTrendReq(hl='en-US', tz=360)
+        _thread_local.pytrends = pytrends
+    return pytrends
+
+
+def _build_payload(pytrends, keywords, timeframe, geo, category=0):
+    # Historical data barely changes, so the 'all' timeframe is kept on disk for longer.
+    pytrends.expire_after = SEASONALITY_CACHE_EXPIRE if timeframe == 'all' else CACHE_EXPIRE
+    pytrends.build_payload(list(keywords), cat=category, timeframe=timeframe, geo=geo)
+
+
+# In-process tier in front of the on-disk request cache. Each helper builds its own payload (a disk hit when
+# another helper just built the same one), so results never depend on what the thread's client fetched last.
+# Callers share the returned objects and must not modify them.
+@ttl_cache(maxsize=256, ttl=CACHE_EXPIRE)
+def _cached_interest_over_time(keywords, timeframe, geo, category):
+    pytrends = _get_pytrends()
+    _build_payload(pytrends, keywords, timeframe, geo, category)
+    return pytrends.interest_over_time()
+
+
+@ttl_cache(maxsize=256, ttl=CACHE_EXPIRE)
+def _cached_related_queries(keywords, timeframe, geo, category):
+    pytrends = _get_pytrends()
+    _build_payload(pytrends, keywords, timeframe, geo, category)
+    return pytrends.related_queries()
+
+
+@ttl_cache(maxsize=256, ttl=CACHE_EXPIRE)
+def _cached_interest_by_region(keywords, timeframe, geo, category, resolution):
+    pytrends = _get_pytrends()
+    _build_payload(pytrends, keywords, timeframe, geo, category)
+    # geo is part of the payload; interest_by_region itself takes no geo argument.
+    return pytrends.interest_by_region(resolution=resolution)
+
+
+def _with_backoff(fetch, *args):
+    # The first call plus up to MAX_RETRIES retries.
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return fetch(*args)
+        except TooManyRequestsError:
+            if attempt == MAX_RETRIES:
+                raise
+        time.sleep(min(MAX_BACKOFF, 2 ** attempt + random.random()))
+
+
+@lru_cache(maxsize=256)
+def _report_basename(keywords):
+    return f"{'_'.join(keywords).replace(' ', '_')}_trends_report"
+
 class GoogleTrendsToolInput(BaseModel):
     keywords: List[str] = Field(..., description="List of keywords to search trends for.")
     timeframe: str = Field(default='now 7-d', description="Time range for trends (e.g., 'now 7-d', 'today 12-m').")
@@ -29,49 +197,39 @@ class GoogleTrendsTool(BaseTool):
     resource_manager: Optional[FileManager] = None
 
     def _execute(self, keywords: List[str], timeframe: str, geo: str, save_format: str, include_related_queries: bool, include_geo_analysis: bool, include_seasonality: bool):
-        pytrends = TrendReq(hl='en-US', tz=360, retries=3, backoff_factor=0.4)
-        
-        combined_data = pd.DataFrame()
-        report = ""
-
+        # Each keyword is fetched and reported once; repeats would collide as columns of the combined data.
+        keywords = list(dict.fromkeys(keywords))
+
+        executor = _get_executor()
+        futures = {
+            executor.submit(self._fetch_keyword, keyword, timeframe, geo, include_related_queries, include_geo_analysis, include_seasonality): keyword
+            for keyword in keywords
+        }
+        results = {}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+        report_parts = []
+        frames = []
         for keyword in keywords:
-            try:
-                pytrends.build_payload([keyword], timeframe=timeframe, geo=geo)
-                data = pytrends.interest_over_time()
-
-                if data.empty:
-                    report += f"No trending data found for '{keyword}'.\n"
-                    continue
-
-                if combined_data.empty:
-                    combined_data = data[[keyword]].copy()
-                else:
-                    combined_data = combined_data.join(data[[keyword]], how='outer')
-
-                report += self._generate_trend_report(data, keyword)
-
-                if include_related_queries:
-                    related_queries = pytrends.related_queries()
-                    report += self._generate_related_queries_report(related_queries, keyword)
-
-                if include_geo_analysis:
-                    geo_data = pytrends.interest_by_region(resolution='CITY', geo=geo)
-                    report += self._generate_geo_report(geo_data, keyword)
-
-                if include_seasonality:
-                    seasonality_data = self._analyze_seasonality(pytrends, keyword, geo)
-                    report += self._generate_seasonality_report(seasonality_data, keyword)
-
-                time.sleep(random.uniform(2, 5))
-
-            except Exception as e:
-                report += f"Error fetching data for '{keyword}': {str(e)}\n"
+            data, keyword_report = results[keyword]
+            report_parts.append(keyword_report)
+            if data is not None:
+                frames.append(data[[keyword]])
+        report = ''.join(report_parts)
+
+        # One outer concat on the date index instead of re-joining the growing frame for every keyword.
+        combined_data = pd.concat(frames, axis=1, join='outer') if frames else pd.DataFrame()
+        # Interest is a 0-100 score; keep it in int16 unless the outer join introduced gaps (float with NaN).
+        combined_data = combined_data.astype({
+            column: 'int16' for column, dtype in combined_data.dtypes.items() if pd.api.types.is_integer_dtype(dtype)
+        })
 
         save_path = os.path.join('superagi', 'tools', 'external_tools', 'GoogleTrendsToolkit', 'reports')
         if not os.path.exists(save_path):
             os.makedirs(save_path)
 
-        filename_base = os.path.join(save_path, f"{'_'.join([k.replace(' ', '_') for k in keywords])}_trends_report")
+        filename_base = os.path.join(save_path, _report_basename(tuple(keywords)))
         if save_format == 'csv':
             return self._save_to_csv(combined_data, f"{filename_base}.csv")
         elif save_format == 'json':
@@ -81,93 +239,171 @@ class GoogleTrendsTool(BaseTool):
         else:
             return self._save_to_txt(report, f"{filename_base}.txt")
 
+    def _fetch_keyword(self, keyword, timeframe, geo, include_related_queries, include_geo_analysis, include_seasonality):
+        data = None
+        parts = []
+
+        try:
+            data = _with_backoff(_cached_interest_over_time, (keyword,), timeframe, geo, 0)
+
+            if data.empty:
+                return None, f"No trending data found for '{keyword}'.\n"
+
+            parts.append(self._generate_trend_report(data, keyword))
+
+            if include_related_queries:
+                related_queries = _with_backoff(_cached_related_queries, (keyword,), timeframe, geo, 0)
+                parts.append(self._generate_related_queries_report(related_queries, keyword))
+
+            if include_geo_analysis:
+                geo_data = _with_backoff(_cached_interest_by_region, (keyword,), timeframe, geo, 0, 'CITY')
+                parts.append(self._generate_geo_report(geo_data, keyword))
+
+            if include_seasonality:
+                seasonality_data = self._analyze_seasonality(data, keyword, geo)
+                parts.append(self._generate_seasonality_report(seasonality_data, keyword))
+
+        except Exception as e:
+            parts.append(f"Error fetching data for '{keyword}': {str(e)}\n")
+
+        return data, ''.join(parts)
+
     def _generate_trend_report(self, data, keyword):
-        report = f"Trends Report for '{keyword}':\n\n"
-        report += "Date\t\tInterest\n"
-        report += "-" * 30 + "\n"
+        parts = [f"Trends Report for '{keyword}':\n\n", TREND_TABLE_HEADER]
 
-        for date, value in data[keyword].items():
-            report += f"{date.strftime('%Y-%m-%d')}\t{value}\n"
+        parts.append(data[[keyword]].to_csv(**TREND_TABLE_FORMAT))
 
-        report += "\n"
-        return report
+        parts.append("\n")
+        return ''.join(parts)
 
     def _generate_related_queries_report(self, related_queries, keyword):
-        report = "\nRelated Queries:\n"
-        report += "-" * 30 + "\n"
+        parts = ["\nRelated Queries:\n", SECTION_RULE]
 
         if keyword in related_queries:
             top_queries = related_queries[keyword]['top']
             rising_queries = related_queries[keyword]['rising']
 
             if top_queries is not None:
-                report += f"Top Related Queries for '{keyword}':\n"
-                for _, row in top_queries.iterrows():
-                    report += f"{row['query']} - {row['value']}\n"
+                parts.append(f"Top Related Queries for '{keyword}':\n")
+                for query, value in top_queries[['query', 'value']].itertuples(index=False, name=None):
+                    parts.append(f"{query} - {value}\n")
             else:
-                report += f"No top related queries found for '{keyword}'.\n"
+                parts.append(f"No top related queries found for '{keyword}'.\n")
 
             if rising_queries is not None:
-                report += f"\nRising Queries for '{keyword}':\n"
-                for _, row in rising_queries.iterrows():
-                    report += f"{row['query']} - {row['value']}\n"
+                parts.append(f"\nRising Queries for '{keyword}':\n")
+                for query, value in rising_queries[['query', 'value']].itertuples(index=False, name=None):
+                    parts.append(f"{query} - {value}\n")
             else:
-                report += f"No rising queries found for '{keyword}'.\n"
+                parts.append(f"No rising queries found for '{keyword}'.\n")
         else:
-            report += f"No related queries data available for '{keyword}'.\n"
+            parts.append(f"No related queries data available for '{keyword}'.\n")
 
-        report += "\n"
-        return report
+        parts.append("\n")
+        return ''.join(parts)
 
     def _generate_geo_report(self, geo_data, keyword):
-        report = "\nGeographical Analysis:\n"
-        report += "-" * 30 + "\n"
+        parts = ["\nGeographical Analysis:\n", SECTION_RULE]
 
         if geo_data.empty:
             return "No geographical data available.\n"
 
-        geo_data_sorted = geo_data.sort_values(by=keyword, ascending=False).head(10)
-        for region, row in geo_data_sorted.iterrows():
-            report += f"{region} - {row[keyword]}\n"
+        geo_data_sorted = geo_data.nlargest(10, keyword)
+        for region, value in zip(geo_data_sorted.index, geo_data_sorted[keyword].to_numpy()):
+            parts.append(f"{region} - {value}\n")
 
-        report += "\n"
-        return report
+        parts.append("\n")
+        return ''.join(parts)
 
-    def _analyze_seasonality(self, pytrends, keyword, geo):
-        pytrends.build_payload([keyword], timeframe='all', geo=geo)
-        seasonality_data = pytrends.interest_over_time()
+    def _analyze_seasonality(self, data, keyword, geo):
+        # Two years of already-fetched history is enough to show seasonal peaks without another request.
+        if data.index.max() - data.index.min() >= SEASONALITY_MIN_SPAN:
+            return data
+
+        seasonality_data = _with_backoff(_cached_interest_over_time, (keyword,), 'all', geo, 0)
         return seasonality_data
 
     def _generate_seasonality_report(self, seasonality_data, keyword):
-        report = "\nSeasonality Analysis:\n"
-        report += "-" * 30 + "\n"
+        parts = ["\nSeasonality Analysis:\n", SECTION_RULE]
 
         if seasonality_data.empty:
             return "No seasonality data available.\n"
 
-        report += f"\nSeasonality for '{keyword}':\n"
-        max_interest = seasonality_data[keyword].max()
-        peak_dates = seasonality_data[seasonality_data[keyword] == max_interest].index
+        parts.append(f"\nSeasonality for '{keyword}':\n")
+        interest = seasonality_data[keyword]
+        max_interest = interest.max()
+        peak_dates = interest.index[interest.to_numpy() == max_interest]
 
-        for date in peak_dates:
-            report += f"Peak interest on {date.strftime('%Y-%m-%d')} with value {max_interest}\n"
+        for date in peak_dates.strftime('%Y-%m-%d'):
+            parts.append(f"Peak interest on {date} with value {max_interest}\n")
 
-        report += "\n"
-        return report
+        parts.append("\n")
+        return ''.join(parts)
 
     def _save_to_txt(self, report, filename):
         self.resource_manager.write_file(filename, report)
         return f"Successfully saved report to {filename}."
 
     def _save_to_csv(self, data, filename):
-        data.to_csv(filename, index=True)
+        # Serialize SAVE_CHUNK_ROWS rows at a time so the whole file never sits in memory next to the frame.
+        # Dates are rendered once for the whole index: pandas picks the date format from the values it is given,
+        # so rendering per chunk could format the chunks differently.
+        dates = data.index.astype(str)
+        if pa is not None:
+            # The file must not depend on whether pyarrow is installed, so Arrow only writes the rows, and the
+            # values Arrow would render differently from pandas (dates, floats) are pre-rendered the pandas way.
+            # The header goes through the csv module, which pandas also uses, as Arrow always quotes it.
+            header = io.StringIO()
+            csv.writer(header, lineterminator='\n').writerow([data.index.name or ''] + list(data.columns))
+            with open(filename, 'wb') as f:
+                f.write(header.getvalue().encode())
+                writer = None
+                for start in range(0, len(data), SAVE_CHUNK_ROWS):
+                    batch = self._csv_record_batch(data.iloc[start:start + SAVE_CHUNK_ROWS], dates[start:start + SAVE_CHUNK_ROWS])
+                    if writer is None:
+                        writer = pacsv.CSVWriter(f, batch.schema, write_options=pacsv.WriteOptions(include_header=False, quoting_style='none'))
+                    writer.write_batch(batch)
+                if writer is not None:
+                    writer.close()
+        else:
+            # The range always yields one chunk so an empty frame still gets its header.
+            with open(filename, 'w', newline='') as f:
+                for start in range(0, max(len(data), 1), SAVE_CHUNK_ROWS):
+                    chunk = data.iloc[start:start + SAVE_CHUNK_ROWS]
+                    chunk.set_axis(dates[start:start + SAVE_CHUNK_ROWS]).to_csv(f, header=start == 0, index=True)
         return f"Successfully saved report to {filename}."
 
+    def _csv_record_batch(self, chunk, dates):
+        arrays = [pa.array(dates.to_numpy(dtype=object), type=pa.string())]
+        for _, values in chunk.items():
+            if pd.api.types.is_float_dtype(values.dtype):
+                # Arrow writes 7.0 as "7"; pandas keeps "7.0" and leaves NaN empty.
+                rendered = values.astype(str).fillna('').to_numpy(dtype=object)
+                arrays.append(pa.array(rendered, type=pa.string(), mask=values.isna().to_numpy()))
+            else:
+                arrays.append(pa.array(values.to_numpy()))
+        # Column names are irrelevant without a header and may not be strings.
+        return pa.RecordBatch.from_arrays(arrays, names=[str(i) for i in range(len(arrays))])
+
     def _save_to_json(self, data, filename):
-        data.to_json(filename, orient='records', date_format='iso')
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(b'[')
+                for start in range(0, len(data), SAVE_CHUNK_ROWS):
+                    records = data.iloc[start:start + SAVE_CHUNK_ROWS].to_dict(orient='records')
+                    if start:
+                        f.write(b',')
+                    # Strip the chunk's own brackets so the chunks form one JSON array.
+                    f.write(orjson.dumps(records, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)[1:-1])
+                f.write(b']')
+        else:
+            data.to_json(filename, orient='records', date_format='iso')
         return f"Successfully saved data to {filename}."
 
     def _save_to_db(self, data, table_name):
-        engine = create_engine('sqlite:///trends.db')
-        data.to_sql(table_name, con=engine, if_exists='replace', index=True)
+        engine = create_engine('sqlite:///trends.db', future=True)
+        # Multi-row INSERTs bind one parameter per cell (index included), so size chunks to SQLite's variable limit.
+        chunksize = max(1, SQLITE_MAX_VARIABLES // (len(data.columns) + 1))
+        with engine.begin() as conn:
+            data.to_sql(table_name, con=conn, if_exists='replace', index=True, method='multi', chunksize=chunksize)
         return f"Data saved to database table '{table_name}'."